@@ -0,0 +1,73 @@
+"""
+Offline generator for the AI's opening book.
+
+Enumerates every position reachable within the first few plies (any of
+the three players may open, so every player is tried at every step),
+searches each one deeper than the in-game dynamic_depth() allows, and
+writes the AI's best column per canonical position hash to book.json.
+main.py loads that file automatically at import when it exists.
+
+Usage:
+    python book_gen.py [plies] [depth]
+
+Defaults to 2 plies at depth 8; expect the full run to take a while.
+"""
+import json
+import sys
+
+from main import AI, BOARD_SIZE, NEG_INF, P1, P2, POS_INF, Connect4
+
+
+def record_position(game, book, depth):
+    """
+    Search the current position and store the AI's best column.
+
+    Args:
+        game (Connect4): Game holding the position to search
+        book (dict): Canonical hash -> best column, updated in place
+        depth (int): Fixed iterative-deepening depth
+    """
+    mirrored = game.hash_mirror < game.hash
+    canonical = game.hash_mirror if mirrored else game.hash
+    if canonical in book:
+        return
+    game.search_opponent = game._pick_opponent()
+    col = None
+    for d in range(1, depth + 1):
+        col, _ = game.negamax(d, NEG_INF, POS_INF, 1)
+        game.pv_move = col
+    book[canonical] = BOARD_SIZE - 1 - col if mirrored else col
+
+
+def walk_positions(game, book, plies, depth):
+    """
+    Recursively visit all positions reachable within the given plies.
+
+    Args:
+        game (Connect4): Game used as a scratch board
+        book (dict): Canonical hash -> best column, updated in place
+        plies (int): Remaining plies to expand
+        depth (int): Search depth passed through to record_position
+    """
+    record_position(game, book, depth)
+    if plies == 0:
+        return
+    for player in (P1, P2, AI):
+        for col in game.get_valid_moves():
+            game.make_move(col, player)
+            walk_positions(game, book, plies - 1, depth)
+            game.undo_move(col)
+
+
+def main(plies, depth):
+    game = Connect4(verbose=False)
+    book = {}
+    walk_positions(game, book, plies, depth)
+    with open("book.json", "w") as f:
+        json.dump(book, f)
+    print(f"Wrote {len(book)} positions to book.json")
+
+
+if __name__ == "__main__":
+    main(plies=int(sys.argv[1]) if len(sys.argv) > 1 else 2,
+         depth=int(sys.argv[2]) if len(sys.argv) > 2 else 8)
@@ -0,0 +1,94 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""
+Optional C kernel for the Connect 4 position evaluator.
+
+Mirrors the jitted _score_position kernel in main.py for users who
+cannot install Numba. Build with:
+
+    python setup.py build_ext --inplace
+
+main.py picks this up automatically when Numba is unavailable. The
+scoring rules themselves live in main.py's SCORE_LUT, which is passed
+in so the two kernels can never drift apart.
+"""
+
+
+cpdef int score_position_c(const signed char[:, :] board, int player,
+                           const int[:, :] lut):
+    """
+    Compute the heuristic score of a board for a player.
+
+    Args:
+        board: int8 board array
+        player: Player to evaluate position for
+        lut: SCORE_LUT from main.py, (4, 256) window scores
+
+    Returns:
+        Total score for the position
+    """
+    cdef int size = board.shape[0]
+    cdef int score = 0
+    cdef int r, c, k, s, w, n
+
+    # Center column weighting
+    for r in range(size):
+        if board[r, size // 2] == player:
+            score += 6
+
+    # Horizontal scoring: rolling 2-bit-per-cell register per row
+    for r in range(size):
+        w = 0
+        for c in range(size):
+            w = ((w << 2) & 0xFF) | board[r, c]
+            if c >= 3:
+                s = lut[player, w]
+                if s == 100:  # won window: see FORCED_WIN_SCORE in main.py
+                    return 100000
+                score += s
+
+    # Vertical scoring
+    for c in range(size):
+        w = 0
+        for r in range(size):
+            w = ((w << 2) & 0xFF) | board[r, c]
+            if r >= 3:
+                s = lut[player, w]
+                if s == 100:  # won window: see FORCED_WIN_SCORE in main.py
+                    return 100000
+                score += s
+
+    # Positive slope diagonal scoring
+    for k in range(-(size - 4), size - 3):
+        r = -k if k < 0 else 0
+        c = k if k > 0 else 0
+        w = 0
+        n = 0
+        while r < size and c < size:
+            w = ((w << 2) & 0xFF) | board[r, c]
+            n += 1
+            if n >= 4:
+                s = lut[player, w]
+                if s == 100:  # won window: see FORCED_WIN_SCORE in main.py
+                    return 100000
+                score += s
+            r += 1
+            c += 1
+
+    # Negative slope diagonal scoring
+    for s in range(3, 2 * size - 4):
+        r = s if s < size else size - 1
+        c = s - r
+        w = 0
+        n = 0
+        while r >= 0 and c < size:
+            w = ((w << 2) & 0xFF) | board[r, c]
+            n += 1
+            if n >= 4:
+                s = lut[player, w]
+                if s == 100:  # won window: see FORCED_WIN_SCORE in main.py
+                    return 100000
+                score += s
+            r -= 1
+            c += 1
+
+    return score
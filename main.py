@@ -1,5 +1,8 @@
 import numpy as np
+import json
+import os
 import random
+import sys
 from typing import Tuple, Optional
 
 """
@@ -8,27 +11,481 @@ Supports both normal turn-based and random turn modes with 3 players (2 human, 1
 Uses minimax algorithm with alpha-beta pruning for AI moves.
 """
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional: without it the jitted kernels run as plain Python.
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    # Optional compiled evaluator for users without Numba; built from
+    # connect4_kernel.pyx via `python setup.py build_ext --inplace`.
+    import connect4_kernel
+    CYTHON_AVAILABLE = True
+except ImportError:
+    CYTHON_AVAILABLE = False
+
 BOARD_SIZE = 10  # Board dimensions (10x10)
 EMPTY = 0        # Empty cell marker
 P1 = 1          # Player 1 marker
 P2 = 2          # Player 2 marker
 AI = 3          # AI player marker
 
+# Zobrist keys: one random 64-bit value per (player, cell), index 0 unused.
+# Seeded so hashes are reproducible across runs.
+_zobrist_rng = random.Random(0x5EED)
+ZOBRIST = [[_zobrist_rng.getrandbits(64) for _ in range(BOARD_SIZE * BOARD_SIZE)]
+           for _ in range(4)]
+_SIDE_KEY = _zobrist_rng.getrandbits(64)  # distinguishes max/min nodes in the TT
+
+# Transposition table entry flags
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+
+# Integer score bounds: all scores are ints, so alpha/beta never need
+# float infinities (and the terminal values stay well inside the bounds).
+WIN_SCORE = 1000000
+POS_INF = 10 ** 9
+NEG_INF = -POS_INF
+# Sentinel returned by the scorers when the player already has a won
+# window; minimax treats wins as terminal before scoring, so this is a
+# safety net that also skips the rest of the scan.
+FORCED_WIN_SCORE = 100000
+
+NULL_MOVE_R = 2  # Depth reduction for null-move pruning
+MAX_DEPTH = 32   # Upper bound on search depth (sizes the killer-move table)
+
+# Display symbols indexed by cell value (EMPTY, P1, P2, AI)
+SYMBOLS = ("⬜", "🔴", "🔵", "🤖")
+
+# Candidates for random turn order, keyed by the player who would
+# otherwise go three times in a row (0: no restriction).
+NEXT_PLAYERS = {0: (P1, P2, AI), P1: (P2, AI), P2: (P1, AI), AI: (P1, P2)}
+
+
+def _load_opening_book():
+    """
+    Load the precomputed opening book, if one has been generated.
+
+    The book maps canonical position hashes (the smaller of a position's
+    Zobrist hash and its mirror's) to the AI's best column, searched
+    deeper offline than dynamic_depth() allows in-game. Generate it with
+    book_gen.py; a missing file just means no book moves.
+
+    Returns:
+        dict: Canonical hash -> best column
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "book.json")
+    try:
+        with open(path) as f:
+            return {int(key): col for key, col in json.load(f).items()}
+    except (OSError, ValueError):
+        return {}
+
+
+OPENING_BOOK = _load_opening_book()
+
+
+def _has_win(bitboard):
+    """
+    Test a single player's bitboard for 4 connected pieces.
+
+    Args:
+        bitboard (int): The player's piece mask
+
+    Returns:
+        bool: True if the mask contains a 4-in-a-row
+    """
+    # Shift distances: vertical, horizontal, and the two diagonals in the
+    # (BOARD_SIZE + 1)-bits-per-column layout.
+    for shift in (1, BOARD_SIZE + 1, BOARD_SIZE, BOARD_SIZE + 2):
+        m = bitboard & (bitboard >> shift)
+        if m & (m >> (2 * shift)):
+            return True
+    return False
+
+
+def _build_score_lut():
+    """
+    Precompute window scores for every packed window and player.
+
+    A window of 4 cells is packed into one byte at 2 bits per cell
+    (values 0..3), so SCORE_LUT[player][packed] replaces the per-window
+    counting in evaluate_window with a single table lookup.
+
+    Returns:
+        np.ndarray: int32 array of shape (4, 256), row 0 unused
+    """
+    lut = np.zeros((4, 256), dtype=np.int32)
+    for player in (P1, P2, AI):
+        opponents = [p for p in (P1, P2, AI) if p != player]
+        for packed in range(256):
+            cells = [(packed >> shift) & 3 for shift in (6, 4, 2, 0)]
+            player_count = cells.count(player)
+            empty_count = cells.count(EMPTY)
+            # A window is a threat only if a single other player holds 3 of
+            # its cells — so the AI respects threats from either human, but
+            # a window mixing both humans' pieces threatens nobody.
+            threat = any(cells.count(opp) == 3 for opp in opponents)
+
+            score = 0
+            if player_count == 4:
+                score += 100  # Win condition
+            elif player_count == 3 and empty_count == 1:
+                score += 10  # Strong position
+            elif player_count == 2 and empty_count == 2:
+                score += 5   # Decent position
+            if threat and empty_count == 1:
+                score -= 8  # Block opponent's strong position
+
+            lut[player, packed] = score
+    return lut
+
+
+SCORE_LUT = _build_score_lut()
+
+
+def _build_line_indices():
+    """
+    Precompute the flat board indices of every 4-in-a-row line.
+
+    Enumerates the same horizontal, vertical and diagonal windows the
+    scoring kernel walks, as rows of flat indices into board.ravel().
+
+    Returns:
+        np.ndarray: intp array of shape (n_lines, 4)
+    """
+    lines = []
+    for r in range(BOARD_SIZE):
+        for c in range(BOARD_SIZE - 3):
+            lines.append([r * BOARD_SIZE + c + i for i in range(4)])
+    for c in range(BOARD_SIZE):
+        for r in range(BOARD_SIZE - 3):
+            lines.append([(r + i) * BOARD_SIZE + c for i in range(4)])
+    for r in range(BOARD_SIZE - 3):
+        for c in range(BOARD_SIZE - 3):
+            lines.append([(r + i) * BOARD_SIZE + c + i for i in range(4)])
+    for r in range(3, BOARD_SIZE):
+        for c in range(BOARD_SIZE - 3):
+            lines.append([(r - i) * BOARD_SIZE + c + i for i in range(4)])
+    return np.array(lines, dtype=np.intp)
+
+
+LINE_IDX = _build_line_indices()
+
+
+def _cell_bit(row, col):
+    """
+    Bit for a board cell in the bitboard layout.
+
+    Args:
+        row (int): Board row (0 = top, as in self.board)
+        col (int): Board column
+
+    Returns:
+        int: Single-bit mask for that cell
+    """
+    return 1 << (col * (BOARD_SIZE + 1) + (BOARD_SIZE - 1 - row))
+
+
+def _build_window_masks():
+    """
+    Precompute a bitboard mask for every 4-in-a-row window.
+
+    Follows the same enumeration order as LINE_IDX so window i refers to
+    the same 4 cells in both representations.
+
+    Returns:
+        tuple: One int mask per window
+    """
+    masks = []
+    for line in LINE_IDX:
+        mask = 0
+        for flat in line:
+            flat = int(flat)  # keep the shifts in arbitrary-precision ints
+            mask |= _cell_bit(flat // BOARD_SIZE, flat % BOARD_SIZE)
+        masks.append(mask)
+    return tuple(masks)
+
+
+WINDOW_MASKS = _build_window_masks()
+CENTER_MASK = sum(_cell_bit(r, BOARD_SIZE // 2) for r in range(BOARD_SIZE))
+
+
+def _build_count_lut():
+    """
+    Precompute the positional window scores keyed by (player, empty) counts.
+
+    Same positional rules as SCORE_LUT, indexed by popcounts of a window
+    mask ANDed with the player/occupancy bitboards. The -8 threat bonus
+    needs to know which single opponent holds the window's other pieces,
+    so _score_position_bitboard applies it separately from the masks.
+
+    Returns:
+        list: COUNT_LUT[pc][ec] -> window score
+    """
+    lut = [[0] * 5 for _ in range(5)]
+    for pc in range(5):
+        for ec in range(5 - pc):
+            score = 0
+            if pc == 4:
+                score += 100  # Win condition
+            elif pc == 3 and ec == 1:
+                score += 10  # Strong position
+            elif pc == 2 and ec == 2:
+                score += 5   # Decent position
+            lut[pc][ec] = score
+    return lut
+
+
+COUNT_LUT = _build_count_lut()
+
+
+def _score_position_bitboard(bitboards, player):
+    """
+    Allocation-free scorer working directly on the bitboards.
+
+    Each window costs three popcounts and a COUNT_LUT lookup. A full
+    scan over all windows is slower in Python than the vectorized numpy
+    fallback, so score_position does not route through this; it exists
+    for callers that only need a handful of windows rescored, where the
+    per-window cost is all that matters.
+
+    Args:
+        bitboards (list): Per-player bitboards, indexed by player marker
+        player (int): Player to evaluate position for
+
+    Returns:
+        int: Total score for the position
+    """
+    player_mask = bitboards[player]
+    opp_a, opp_b = [bitboards[p] for p in (P1, P2, AI) if p != player]
+    occupied = bitboards[P1] | bitboards[P2] | bitboards[AI]
+    score = 6 * (player_mask & CENTER_MASK).bit_count()
+    for w in WINDOW_MASKS:
+        pc = (player_mask & w).bit_count()
+        if pc == 4:
+            return FORCED_WIN_SCORE
+        ec = 4 - (occupied & w).bit_count()
+        score += COUNT_LUT[pc][ec]
+        if ec == 1 and pc == 0 and ((opp_a & w).bit_count() == 3
+                                    or (opp_b & w).bit_count() == 3):
+            score -= 8  # Block opponent's strong position
+    return score
+
+# Dot weights packing a gathered (n_lines, 4) cell matrix into the same
+# 2-bit-per-cell bytes SCORE_LUT is indexed by.
+_PACK_WEIGHTS = np.array([64, 16, 4, 1], dtype=np.int32)
+
+
+def _score_position_numpy(board, player):
+    """
+    Vectorized scoring fallback used when Numba is unavailable.
+
+    Gathers all 4-cell lines in one fancy-indexing pass, packs each line
+    into a SCORE_LUT byte with a single matrix-vector product, and sums
+    the looked-up window scores — so the fallback shares the exact same
+    scoring table as the compiled kernels.
+
+    Args:
+        board (np.ndarray): int8 board array
+        player (int): Player to evaluate position for
+
+    Returns:
+        int: Total score for the position
+    """
+    scores = SCORE_LUT[player, board.ravel()[LINE_IDX] @ _PACK_WEIGHTS]
+    if (scores == 100).any():  # a won window dominates everything else
+        return FORCED_WIN_SCORE
+    score = int(scores.sum())
+    score += 6 * int((board[:, BOARD_SIZE // 2] == player).sum())
+    return score
+
+
+# Explicit signatures compile the kernels eagerly at import and, with
+# cache=True, persist the compiled code on disk — so only the very first
+# run ever pays the JIT cost, not every process start. (numba.pycc AOT
+# compilation was deprecated upstream; eager signatures + cache give the
+# same no-warmup behaviour.)
+@njit(["int32(int8[::1], int64)"], cache=True)
+def _evaluate_window(window, player):
+    """
+    Jitted kernel scoring a window of 4 cells for the given player.
+
+    Args:
+        window (np.ndarray): int8 array of 4 cells
+        player (int): Player to evaluate score for
+
+    Returns:
+        int: Score for the window
+    """
+    score = 0
+
+    empty_count = 0
+    n1 = 0
+    n2 = 0
+    n3 = 0
+    for k in range(4):
+        v = window[k]
+        if v == EMPTY:
+            empty_count += 1
+        elif v == P1:
+            n1 += 1
+        elif v == P2:
+            n2 += 1
+        else:
+            n3 += 1
+
+    if player == P1:
+        player_count, opp_a, opp_b = n1, n2, n3
+    elif player == P2:
+        player_count, opp_a, opp_b = n2, n1, n3
+    else:
+        player_count, opp_a, opp_b = n3, n1, n2
+
+    if player_count == 4:
+        score += 100  # Win condition
+    elif player_count == 3 and empty_count == 1:
+        score += 10  # Strong position
+    elif player_count == 2 and empty_count == 2:
+        score += 5   # Decent position
+
+    # A single other player holding 3 cells with one empty is a threat;
+    # a window mixing both opponents' pieces threatens nobody.
+    if empty_count == 1 and (opp_a == 3 or opp_b == 3):
+        score -= 8  # Block opponent's strong position
+
+    return score
+
+
+@njit(["int32(int8[:, ::1], int64)"], cache=True)
+def _score_position(board, player):
+    """
+    Jitted kernel computing the heuristic score of a board for a player.
+
+    Args:
+        board (np.ndarray): int8 board array
+        player (int): Player to evaluate position for
+
+    Returns:
+        int: Total score for the position
+    """
+    score = 0
+
+    # Center column weighting
+    center_count = 0
+    for r in range(BOARD_SIZE):
+        if board[r, BOARD_SIZE // 2] == player:
+            center_count += 1
+    score += center_count * 6  # Increased weight for central control
+
+    # Horizontal scoring: roll a 2-bit-per-cell register along each row so
+    # every window costs one shift, one OR and one table lookup.
+    for r in range(BOARD_SIZE):
+        w = 0
+        for c in range(BOARD_SIZE):
+            w = ((w << 2) & 0xFF) | board[r, c]
+            if c >= 3:
+                s = SCORE_LUT[player, w]
+                if s == 100:  # won window: no need to scan further
+                    return FORCED_WIN_SCORE
+                score += s
+
+    # Vertical scoring
+    for c in range(BOARD_SIZE):
+        w = 0
+        for r in range(BOARD_SIZE):
+            w = ((w << 2) & 0xFF) | board[r, c]
+            if r >= 3:
+                s = SCORE_LUT[player, w]
+                if s == 100:  # won window: no need to scan further
+                    return FORCED_WIN_SCORE
+                score += s
+
+    # Positive slope diagonal scoring: walk each diagonal once, reusing the
+    # rolling register so consecutive windows share 3 of their 4 cells.
+    for k in range(-(BOARD_SIZE - 4), BOARD_SIZE - 3):
+        r = -k if k < 0 else 0
+        c = k if k > 0 else 0
+        w = 0
+        n = 0
+        while r < BOARD_SIZE and c < BOARD_SIZE:
+            w = ((w << 2) & 0xFF) | board[r, c]
+            n += 1
+            if n >= 4:
+                s = SCORE_LUT[player, w]
+                if s == 100:  # won window: no need to scan further
+                    return FORCED_WIN_SCORE
+                score += s
+            r += 1
+            c += 1
+
+    # Negative slope diagonal scoring: same walk along the anti-diagonals
+    for s in range(3, 2 * BOARD_SIZE - 4):
+        r = s if s < BOARD_SIZE else BOARD_SIZE - 1
+        c = s - r
+        w = 0
+        n = 0
+        while r >= 0 and c < BOARD_SIZE:
+            w = ((w << 2) & 0xFF) | board[r, c]
+            n += 1
+            if n >= 4:
+                s = SCORE_LUT[player, w]
+                if s == 100:  # won window: no need to scan further
+                    return FORCED_WIN_SCORE
+                score += s
+            r -= 1
+            c += 1
+
+    return score
+
 class Connect4:
     """
     Main game class implementing Connect 4 mechanics and AI opponent.
     
     Attributes:
-        board (np.ndarray): 10x10 game board array
-        last_two_players (list): Tracks last two players for random mode
+        board (np.ndarray): 10x10 game board array (kept for display/scoring)
+        bitboards (list): One bitboard int per player, indexed by player marker
+        heights (list): Number of pieces stacked in each column
         turn_order (list): Defines player sequence [P1, P2, AI]
         current_turn_index (int): Current position in turn order
+        verbose (bool): Whether print_board renders anything (disable
+            for self-play or benchmarking)
     """
-    
-    def __init__(self):
-        """Initialize game board and turn tracking."""
-        self.board = np.zeros((BOARD_SIZE, BOARD_SIZE))
-        self.last_two_players = []
+
+    def __init__(self, verbose: bool = True):
+        """
+        Initialize game board and turn tracking.
+
+        Args:
+            verbose (bool): Set False to silence print_board
+        """
+        self.verbose = verbose
+        self.board = np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=np.int8)
+        # One bitboard per player marker (index 0 unused). Each column uses
+        # BOARD_SIZE + 1 bits (one sentinel bit between columns) so the
+        # directional shifts in check_for_win can't wrap across columns.
+        self.bitboards = [0, 0, 0, 0]
+        self.heights = [0] * BOARD_SIZE
+        self.empty_count = BOARD_SIZE * BOARD_SIZE
+        self.hash = 0  # Incremental Zobrist hash of the position
+        self.hash_mirror = 0  # Hash of the left-right mirrored position
+        self.tt = {}   # Transposition table: key -> (depth, value, flag, best_move)
+        self.pv_move = None  # Best root move from the previous deepening iteration
+        self.search_opponent = P1  # Human opponent modeled by the minimizing branch
+        # Move-ordering state: two killer moves per depth, and a history
+        # score per (player, column) bumped on beta cutoffs.
+        self.killers = [[None, None] for _ in range(MAX_DEPTH + 1)]
+        self.history = np.zeros((4, BOARD_SIZE), dtype=np.int32)
+        self._prev = 0   # Last player in random mode (0: none yet)
+        self._prev2 = 0  # Player before that
         self.turn_order = [P1, P2, AI]
         self.current_turn_index = 0
 
@@ -39,23 +496,15 @@ class Connect4:
         🔴 for Player 1
         🔵 for Player 2
         🤖 for AI
+
+        No-op when the game was created with verbose=False.
         """
-        print(" ", end=" ")
-        for i in range(BOARD_SIZE):
-            print(f"{i+1:2}", end=" ")
-        print()
-        
+        if not self.verbose:
+            return
+        lines = ["  " + " ".join(f"{i+1:2}" for i in range(BOARD_SIZE))]
         for row in self.board:
-            for cell in row:
-                if cell == EMPTY:
-                    print("⬜", end=" ")
-                elif cell == P1:
-                    print("🔴", end=" ")
-                elif cell == P2:
-                    print("🔵", end=" ")
-                elif cell == AI:
-                    print("🤖", end=" ")
-            print()
+            lines.append(" ".join(SYMBOLS[cell] for cell in row))
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def check_for_win(self, player: int) -> bool:
         """
@@ -67,31 +516,19 @@ class Connect4:
         Returns:
             bool: True if player has won, False otherwise
         """
-        # Horizontal check
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE - 3):
-                if np.all(self.board[row, col:col+4] == player):
-                    return True
-        
-        # Vertical check
-        for row in range(BOARD_SIZE - 3):
-            for col in range(BOARD_SIZE):
-                if np.all(self.board[row:row+4, col] == player):
-                    return True
-        
-        # Diagonal check (positive slope)
-        for row in range(BOARD_SIZE - 3):
-            for col in range(BOARD_SIZE - 3):
-                if np.all([self.board[row+i, col+i] == player for i in range(4)]):
-                    return True
-        
-        # Diagonal check (negative slope)
-        for row in range(3, BOARD_SIZE):
-            for col in range(BOARD_SIZE - 3):
-                if np.all([self.board[row-i, col+i] == player for i in range(4)]):
-                    return True
-        
-        return False
+        return _has_win(self.bitboards[player])
+
+    def winner(self) -> int:
+        """
+        Find which player, if any, has connected 4 pieces.
+
+        Returns:
+            int: P1, P2 or AI if that player has won, EMPTY otherwise
+        """
+        for player in (P1, P2, AI):
+            if _has_win(self.bitboards[player]):
+                return player
+        return EMPTY
 
     def is_valid_move(self, col: int) -> bool:
         """
@@ -103,7 +540,7 @@ class Connect4:
         Returns:
             bool: True if move is valid, False otherwise
         """
-        return 0 <= col < BOARD_SIZE and self.board[0][col] == EMPTY
+        return 0 <= col < BOARD_SIZE and self.heights[col] < BOARD_SIZE
 
     def get_valid_moves(self) -> list:
         """
@@ -112,7 +549,8 @@ class Connect4:
         Returns:
             list: List of valid column indices
         """
-        return [col for col in range(BOARD_SIZE) if self.is_valid_move(col)]
+        heights = self.heights
+        return [col for col in range(BOARD_SIZE) if heights[col] < BOARD_SIZE]
 
     def make_move(self, col: int, player: int) -> bool:
         """
@@ -125,11 +563,34 @@ class Connect4:
         Returns:
             bool: True if move was successful, False if invalid
         """
-        for row in range(BOARD_SIZE-1, -1, -1):
-            if self.board[row, col] == EMPTY:
-                self.board[row, col] = player
-                return True
-        return False
+        height = self.heights[col]
+        if height >= BOARD_SIZE:
+            return False
+        row = BOARD_SIZE - 1 - height
+        self.bitboards[player] |= 1 << (col * (BOARD_SIZE + 1) + height)
+        self.board[row, col] = player
+        self.heights[col] = height + 1
+        self.empty_count -= 1
+        self.hash ^= ZOBRIST[player][row * BOARD_SIZE + col]
+        self.hash_mirror ^= ZOBRIST[player][row * BOARD_SIZE + (BOARD_SIZE - 1 - col)]
+        return True
+
+    def undo_move(self, col: int):
+        """
+        Remove the topmost piece from the specified column.
+
+        Args:
+            col (int): Column to remove the last piece from
+        """
+        height = self.heights[col] - 1
+        row = BOARD_SIZE - 1 - height
+        player = int(self.board[row, col])
+        self.bitboards[player] ^= 1 << (col * (BOARD_SIZE + 1) + height)
+        self.board[row, col] = EMPTY
+        self.heights[col] = height
+        self.empty_count += 1
+        self.hash ^= ZOBRIST[player][row * BOARD_SIZE + col]
+        self.hash_mirror ^= ZOBRIST[player][row * BOARD_SIZE + (BOARD_SIZE - 1 - col)]
 
     def evaluate_window(self, window: np.ndarray, player: int) -> int:
         """
@@ -142,20 +603,7 @@ class Connect4:
         Returns:
             int: Score for the window (-inf to +inf)
         """
-        score = 0
-        opponent = P1 if player != P1 else P2
-        
-        if np.sum(window == player) == 4:
-            score += 100  # Win condition
-        elif np.sum(window == player) == 3 and np.sum(window == EMPTY) == 1:
-            score += 10  # Strong position
-        elif np.sum(window == player) == 2 and np.sum(window == EMPTY) == 2:
-            score += 5   # Decent position
-        
-        if np.sum(window == opponent) == 3 and np.sum(window == EMPTY) == 1:
-            score -= 8  # Block opponent's strong position
-        
-        return score
+        return int(_evaluate_window(np.ascontiguousarray(window, dtype=np.int8), player))
 
     def score_position(self, player: int) -> int:
         """
@@ -167,120 +615,161 @@ class Connect4:
         Returns:
             int: Total score for the position
         """
-        score = 0
-        opponent = P1 if player != P1 else P2
-        
-        # Center column weighting
-        center_array = self.board[:, BOARD_SIZE // 2]
-        center_count = np.sum(center_array == player)
-        score += center_count * 6  # Increased weight for central control
-        
-        # Horizontal scoring
-        for r in range(BOARD_SIZE):
-            row_array = self.board[r, :]
-            for c in range(BOARD_SIZE - 3):
-                window = row_array[c:c + 4]
-                score += self.evaluate_window(window, player)
-        
-        # Vertical scoring
-        for c in range(BOARD_SIZE):
-            col_array = self.board[:, c]
-            for r in range(BOARD_SIZE - 3):
-                window = col_array[r:r + 4]
-                score += self.evaluate_window(window, player)
-        
-        # Positive slope diagonal scoring
-        for r in range(BOARD_SIZE - 3):
-            for c in range(BOARD_SIZE - 3):
-                window = [self.board[r + i][c + i] for i in range(4)]
-                score += self.evaluate_window(np.array(window), player)
-        
-        # Negative slope diagonal scoring
-        for r in range(3, BOARD_SIZE):
-            for c in range(BOARD_SIZE - 3):
-                window = [self.board[r - i][c + i] for i in range(4)]
-                score += self.evaluate_window(np.array(window), player)
+        if NUMBA_AVAILABLE:
+            return int(_score_position(self.board, player))
+        if CYTHON_AVAILABLE:
+            return connect4_kernel.score_position_c(self.board, player, SCORE_LUT)
+        return _score_position_numpy(self.board, player)
 
-        return score
-
-    def minimax(self, depth: int, alpha: float, beta: float, maximizing_player: bool) -> Tuple[Optional[int], int]:
+    def negamax(self, depth: int, alpha: int, beta: int, side: int,
+                last_player: Optional[int] = None) -> Tuple[Optional[int], int]:
         """
-        Minimax algorithm with alpha-beta pruning for AI move selection.
-        
+        Negamax search with alpha-beta pruning for AI move selection.
+
+        Scores are always from the side to move's point of view, so one
+        code path serves both the AI's and the opponent's turns: each
+        child is searched with the window negated and flipped, and its
+        value negated back.
+
         Args:
             depth (int): Current search depth
-            alpha (float): Alpha value for pruning
-            beta (float): Beta value for pruning
-            maximizing_player (bool): True if maximizing, False if minimizing
-            
+            alpha (int): Alpha value for pruning
+            beta (int): Beta value for pruning
+            side (int): +1 if the AI is to move, -1 for the opponent
+            last_player (Optional[int]): Who made the move leading here;
+                only their bitboard can newly contain a win. None at the
+                root, where all players are checked.
+
         Returns:
             Tuple[Optional[int], int]: Best move column and its score
         """
         valid_moves = self.get_valid_moves()
-        is_terminal = self.check_for_win(P1) or self.check_for_win(P2) or self.check_for_win(AI) or not valid_moves
+        if last_player is None:
+            winner = self.winner()
+        else:
+            winner = last_player if _has_win(self.bitboards[last_player]) else EMPTY
+        is_terminal = winner != EMPTY or not valid_moves
 
-        # Terminal node or depth reached
+        # Terminal node or depth reached: evaluate for the AI, then flip
+        # into the side to move's perspective.
         if depth == 0 or is_terminal:
             if is_terminal:
-                if self.check_for_win(AI):
-                    return None, 1000000
-                elif self.check_for_win(P1) or self.check_for_win(P2):
-                    return None, -1000000
+                if winner == AI:
+                    value = WIN_SCORE
+                elif winner != EMPTY:
+                    value = -WIN_SCORE
                 else:
-                    return None, 0
+                    value = 0
             else:
-                return None, self.score_position(AI)
+                value = self.score_position(AI)
+            return None, side * value
 
-        # Prioritize center column and nearby columns
-        center_col = BOARD_SIZE // 2
-        valid_moves.sort(key=lambda col: abs(col - center_col))
+        # Transposition table probe under the canonical orientation: a
+        # position and its left-right mirror share one entry, with stored
+        # moves mapped back through the mirror when needed.
+        mirrored = self.hash_mirror < self.hash
+        canonical = self.hash_mirror if mirrored else self.hash
+        tt_key = canonical if side == 1 else canonical ^ _SIDE_KEY
+        tt_move = None
+        entry = self.tt.get(tt_key)
+        if entry is not None:
+            tt_depth, tt_value, tt_flag, tt_move = entry
+            if mirrored and tt_move is not None:
+                tt_move = BOARD_SIZE - 1 - tt_move
+            if tt_depth >= depth:
+                if tt_flag == TT_EXACT:
+                    return tt_move, tt_value
+                elif tt_flag == TT_LOWER:
+                    alpha = max(alpha, tt_value)
+                else:  # TT_UPPER
+                    beta = min(beta, tt_value)
+                if alpha >= beta:
+                    return tt_move, tt_value
 
-        if maximizing_player:
-            value = float('-inf')
-            column = valid_moves[0]
+        # Null-move pruning: if passing the turn and searching at reduced
+        # depth still fails high, a real move would too — prune.
+        if depth >= 3:
+            null_value = -self.negamax(depth - 1 - NULL_MOVE_R, -beta, -beta + 1,
+                                       -side, last_player)[1]
+            if null_value >= beta:
+                return None, null_value
 
-            for col in valid_moves:
-                # Simulate move
-                for row in range(BOARD_SIZE - 1, -1, -1):
-                    if self.board[row, col] == EMPTY:
-                        self.board[row, col] = AI
-                        break
+        # Move ordering: principal variation first, then the transposition
+        # table's best move, killer moves at this depth, columns with good
+        # history scores, and finally proximity to the center.
+        center_col = BOARD_SIZE // 2
+        killers = self.killers[depth]
+        mover = AI if side == 1 else self.search_opponent
+        history = self.history[mover]
+        valid_moves.sort(key=lambda col: (col == self.pv_move,
+                                          col == tt_move,
+                                          col in killers,
+                                          history[col],
+                                          -abs(col - center_col)),
+                         reverse=True)
 
-                new_score = self.minimax(depth - 1, alpha, beta, False)[1]
-                # Undo move
-                self.board[row, col] = EMPTY
+        alpha_orig = alpha
+        value = NEG_INF
+        column = valid_moves[0]
 
-                if new_score > value:
-                    value = new_score
-                    column = col
-                alpha = max(alpha, value)
-                if alpha >= beta:
-                    break
-            return column, value
+        for col in valid_moves:
+            # Simulate move
+            self.make_move(col, mover)
+            new_score = -self.negamax(depth - 1, -beta, -alpha, -side, mover)[1]
+            # Undo move
+            self.undo_move(col)
+
+            if new_score > value:
+                value = new_score
+                column = col
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                # Beta cutoff: remember the move for sibling nodes
+                if killers[0] != col:
+                    killers[1] = killers[0]
+                    killers[0] = col
+                history[col] += depth * depth
+                break
 
+        # Store the fail-soft result with a bound flag for future probes
+        if value <= alpha_orig:
+            flag = TT_UPPER
+        elif value >= beta:
+            flag = TT_LOWER
         else:
-            value = float('inf')
-            column = valid_moves[0]
-
-            for col in valid_moves:
-                opponent = P1 if self.score_position(P1) > self.score_position(P2) else P2
-                # Simulate move
-                for row in range(BOARD_SIZE - 1, -1, -1):
-                    if self.board[row, col] == EMPTY:
-                        self.board[row, col] = opponent
-                        break
+            flag = TT_EXACT
+        self.tt[tt_key] = (depth, value, flag,
+                           BOARD_SIZE - 1 - column if mirrored else column)
+        return column, value
 
-                new_score = self.minimax(depth - 1, alpha, beta, True)[1]
-                # Undo move
-                self.board[row, col] = EMPTY
+    def search(self) -> Optional[int]:
+        """
+        Run an iterative-deepening negamax search for the AI's move.
 
-                if new_score < value:
-                    value = new_score
-                    column = col
-                beta = min(beta, value)
-                if alpha >= beta:
-                    break
-            return column, value
+        Deepens from 1 up to dynamic_depth(); each iteration's best move
+        seeds the next one's ordering through pv_move and the
+        transposition table.
+
+        Returns:
+            Optional[int]: Best column for the AI, or None if no moves
+        """
+        # Opening-book probe: early positions were searched deeper
+        # offline than dynamic_depth() allows in-game, so a hit skips
+        # the search entirely. Book moves are stored in the canonical
+        # orientation, like transposition table entries.
+        if OPENING_BOOK:
+            mirrored = self.hash_mirror < self.hash
+            canonical = self.hash_mirror if mirrored else self.hash
+            book_move = OPENING_BOOK.get(canonical)
+            if book_move is not None:
+                return BOARD_SIZE - 1 - book_move if mirrored else book_move
+
+        self.search_opponent = self._pick_opponent()
+        col = None
+        for d in range(1, self.dynamic_depth() + 1):
+            col, _ = self.negamax(d, NEG_INF, POS_INF, 1)
+            self.pv_move = col
+        return col
 
     def get_next_player_random(self) -> int:
         """
@@ -289,18 +778,13 @@ class Connect4:
         Returns:
             int: Next player marker (P1, P2, or AI)
         """
-        if len(self.last_two_players) < 2:
-            next_player = random.choice([P1, P2, AI])
+        if self._prev != 0 and self._prev == self._prev2:
+            choices = NEXT_PLAYERS[self._prev]
         else:
-            if self.last_two_players[-1] == self.last_two_players[-2]:
-                possible_players = [p for p in [P1, P2, AI] if p != self.last_two_players[-1]]
-                next_player = random.choice(possible_players)
-            else:
-                next_player = random.choice([P1, P2, AI])
-        
-        self.last_two_players.append(next_player)
-        if len(self.last_two_players) > 2:
-            self.last_two_players.pop(0)
+            choices = NEXT_PLAYERS[0]
+        next_player = choices[random.randrange(len(choices))]
+        self._prev2 = self._prev
+        self._prev = next_player
         return next_player
     
     def get_next_player(self) -> int:
@@ -314,6 +798,18 @@ class Connect4:
         self.current_turn_index = (self.current_turn_index + 1) % len(self.turn_order)
         return player
 
+    def _pick_opponent(self) -> int:
+        """
+        Choose which human player the minimizing branch should model.
+
+        Picked once per search instead of re-evaluating both humans'
+        positions for every child of every minimizing node.
+
+        Returns:
+            int: P1 or P2, whichever currently has the stronger position
+        """
+        return P1 if self.score_position(P1) > self.score_position(P2) else P2
+
     def dynamic_depth(self) -> int:
         """
         Calculate appropriate minimax depth based on game phase.
@@ -321,7 +817,7 @@ class Connect4:
         Returns:
             int: Search depth for minimax algorithm
         """
-        empty_cells = np.sum(self.board == EMPTY)
+        empty_cells = self.empty_count
 
         # Adjust depth based on the game phase
         if empty_cells > 60:  # Early game
@@ -357,8 +853,7 @@ def game():
         print(f"\nPlayer {player_symbols[current_player]}'s turn")
         
         if current_player == AI:
-            depth = game.dynamic_depth()
-            col, _ = game.minimax(depth, float('-inf'), float('inf'), True)
+            col = game.search()
             if col is not None:
                 game.make_move(col, AI)
                 print(f"AI chose column {col + 1}")
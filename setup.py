@@ -0,0 +1,12 @@
+"""Build script for the optional Cython scoring kernel.
+
+Usage:
+    python setup.py build_ext --inplace
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="connect4-kernel",
+    ext_modules=cythonize("connect4_kernel.pyx", language_level=3),
+)